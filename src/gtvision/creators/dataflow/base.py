@@ -32,6 +32,8 @@ class BaseDataFlowCreator(Generic[T], ABC, metaclass=AbstractFactory):
         IterableDataFlow(length=5)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create(self, engine: BaseEngine | None = None) -> BaseDataFlow[T]:
         r"""Create a dataflow.
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 __all__ = ["DataLoaderDataFlowCreator"]
 
+from functools import lru_cache
 from typing import TypeVar
 
 from coola.utils import str_indent, str_mapping
 from gravitorch.data.dataloaders import is_dataloader_config
 from gravitorch.engines.base import BaseEngine
 from gravitorch.experimental.dataflow.dataloader import DataLoaderDataFlow
+from objectory import OBJECT_TARGET
 from torch.utils.data import DataLoader
 
 from gtvision.creators.dataflow.base import BaseDataFlowCreator
@@ -26,6 +28,17 @@ class DataLoaderDataFlowCreator(BaseDataFlowCreator[T]):
             ``BaseDataLoaderCreator``): Specifies a dataloader (or its
             configuration) or a dataloader creator (or its
             configuration).
+        cache (bool, optional): If ``True``, the dataloader is created
+            only the first time, and then the same dataloader is
+            wrapped for each call to the ``create`` method. With
+            ``persistent_workers=True``, it allows to reuse the worker
+            processes between the epochs. If the dataloader is given
+            by its configuration, ``persistent_workers=True`` is added
+            to the configuration if ``num_workers > 0`` and it is not
+            set. Note that the engine is only
+            used to create the first dataloader. Call ``refresh`` to
+            create a new dataloader at the next call to ``create``.
+            Default: ``False``
 
     Example usage:
 
@@ -40,19 +53,73 @@ class DataLoaderDataFlowCreator(BaseDataFlowCreator[T]):
         DataLoaderDataFlow(length=5)
     """
 
-    def __init__(self, dataloader: DataLoader | BaseDataLoaderCreator | dict) -> None:
+    __slots__ = ("_dataloader", "_cache", "_dataloader_instance")
+
+    def __init__(
+        self, dataloader: DataLoader | BaseDataLoaderCreator | dict, cache: bool = False
+    ) -> None:
         if isinstance(dataloader, DataLoader) or (
-            isinstance(dataloader, dict) and is_dataloader_config(dataloader)
+            isinstance(dataloader, dict) and _is_dataloader_target(dataloader.get(OBJECT_TARGET))
         ):
-            dataloader = DataLoaderCreator(dataloader)
+            # The dataloader is cached by this creator so ``refresh`` can
+            # create a new dataloader.
+            dataloader = DataLoaderCreator(dataloader, persistent_workers=cache)
         self._dataloader = setup_dataloader_creator(dataloader)
+        self._cache = bool(cache)
+        self._dataloader_instance = None
 
     def __repr__(self) -> str:
-        config = {"dataloader": self._dataloader}
+        config = {"dataloader": self._dataloader, "cache": self._cache}
         return (
             f"{self.__class__.__qualname__}(\n"
             f"  {str_indent(str_mapping(config, sorted_keys=True))}\n)"
         )
 
     def create(self, engine: BaseEngine | None = None) -> DataLoaderDataFlow[T]:
-        return DataLoaderDataFlow(self._dataloader.create(engine))
+        if self._dataloader_instance is not None:
+            return DataLoaderDataFlow(self._dataloader_instance)
+        dataloader = self._dataloader.create(engine)
+        if self._cache:
+            self._dataloader_instance = dataloader
+        return DataLoaderDataFlow(dataloader)
+
+    def refresh(self) -> None:
+        r"""Removes the cached dataloader, so a new dataloader is created
+        at the next call to ``create``.
+
+        Example usage:
+
+        .. code-block:: pycon
+
+            >>> from gravitorch.data.datasets import ExampleDataset
+            >>> from gtvision.creators.dataflow import DataLoaderDataFlowCreator
+            >>> from gtvision.creators.dataloader import VanillaDataLoaderCreator
+            >>> creator = DataLoaderDataFlowCreator(
+            ...     VanillaDataLoaderCreator(ExampleDataset([1, 2, 3, 4, 5])), cache=True
+            ... )
+            >>> dataflow = creator.create()
+            >>> creator.refresh()
+        """
+        self._dataloader_instance = None
+
+
+@lru_cache(maxsize=256)
+def _is_dataloader_target(target: str | None) -> bool:
+    r"""Indicates if the target is a ``torch.utils.data.DataLoader``.
+
+    The result is cached because checking the target requires to
+    import the object.
+
+    Args:
+    ----
+        target (str or ``None``): Specifies the target i.e. the value
+            of the key ``_target_`` in the configuration.
+
+    Returns:
+    -------
+        bool: ``True`` if the target is a
+            ``torch.utils.data.DataLoader``, otherwise ``False``.
+    """
+    if target is None:
+        return False
+    return is_dataloader_config({OBJECT_TARGET: target})
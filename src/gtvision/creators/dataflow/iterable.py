@@ -2,7 +2,7 @@ from __future__ import annotations
 
 __all__ = ["IterableDataFlowCreator"]
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sized
 from contextlib import suppress
 from typing import TypeVar
 
@@ -25,8 +25,11 @@ class IterableDataFlowCreator(BaseDataFlowCreator[T]):
             configuration.
         cache (bool, optional): If ``True``, the iterable is created
             only the first time, and then a copy of the iterable is
-            returned for each call to the ``create`` method.
-            Default: ``False``
+            returned for each call to the ``create`` method. Caching
+            avoids to instantiate the iterable from its configuration
+            at each call, but it should only be used if the iterable
+            can be iterated several times e.g. it should not be used
+            if the iterable is a generator. Default: ``False``
         **kwargs: See ``IterableDataFlow`` documentation.
 
     Example usage:
@@ -38,6 +41,8 @@ class IterableDataFlowCreator(BaseDataFlowCreator[T]):
         >>> creator.create()
     """
 
+    __slots__ = ("_iterable", "_cache", "_kwargs")
+
     def __init__(self, iterable: Iterable[T], cache: bool = False, **kwargs) -> None:
         self._iterable = iterable
         self._cache = bool(cache)
@@ -45,14 +50,19 @@ class IterableDataFlowCreator(BaseDataFlowCreator[T]):
 
     def __repr__(self) -> str:
         config = {"cache": self._cache} | self._kwargs
-        with suppress(TypeError):
-            config["length"] = f"{len(self._iterable):,}"
+        if isinstance(self._iterable, Sized) and not isinstance(self._iterable, dict):
+            # Some sized objects raise an error if the length is not available
+            # e.g. a DataLoader with an IterableDataset.
+            with suppress(TypeError):
+                config["length"] = f"{len(self._iterable):,}"
         return (
             f"{self.__class__.__qualname__}({str_mapping(config, sorted_keys=True, one_line=True)})"
         )
 
     def create(self, engine: BaseEngine | None = None) -> IterableDataFlow[T]:
-        iterable = setup_object(self._iterable)
-        if self._cache:
-            self._iterable = iterable
+        iterable = self._iterable
+        if isinstance(iterable, dict):
+            iterable = setup_object(iterable)
+            if self._cache:
+                self._iterable = iterable
         return IterableDataFlow(iterable, **self._kwargs)
@@ -53,6 +53,8 @@ class AutoDataLoaderCreator(BaseDataLoaderCreator[T]):
         <torch.utils.data.dataloader.DataLoader object at 0x...>
     """
 
+    __slots__ = ("_dataloader",)
+
     def __init__(self, dataset: Dataset | BaseDatasetCreator | dict, **kwargs) -> None:
         if dist.is_distributed():
             self._dataloader = DistributedDataLoaderCreator(dataset, **kwargs)
@@ -39,6 +39,8 @@ class BaseDataLoaderCreator(Generic[T], ABC, metaclass=AbstractFactory):
         <torch.utils.data.dataloader.DataLoader object at 0x...>
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create(self, engine: BaseEngine | None = None) -> DataLoader[T]:
         r"""Create a dataloader.
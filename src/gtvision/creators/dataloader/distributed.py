@@ -61,6 +61,8 @@ class DistributedDataLoaderCreator(BaseDataLoaderCreator[T]):
         <torch.utils.data.dataloader.DataLoader object at 0x...>
     """
 
+    __slots__ = ("_dataset", "_shuffle", "_drop_last", "_seed", "_kwargs")
+
     def __init__(
         self,
         dataset: Dataset | BaseDatasetCreator | dict,
@@ -7,17 +7,12 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from gravitorch.utils.format import str_target_object
-from gravitorch.utils.imports import is_torchdata_available
 from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
-if is_torchdata_available():
-    from torchdata.dataloader2 import DataLoader2
-else:  # pragma: no cover
-    DataLoader2 = "DataLoader2"
-
 if TYPE_CHECKING:
     from gravitorch.engines import BaseEngine
+    from torchdata.dataloader2 import DataLoader2
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +34,8 @@ class BaseDataLoader2Creator(Generic[T], ABC, metaclass=AbstractFactory):
         <torchdata.dataloader2.dataloader2.DataLoader2 object at 0x...>
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create(self, engine: BaseEngine | None = None) -> DataLoader2[T]:
         r"""Create a dataloader.
@@ -4,26 +4,21 @@ __all__ = ["DataLoader2Creator", "VanillaDataLoader2Creator"]
 
 import logging
 from collections.abc import Iterable
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from coola.utils import str_indent, str_mapping
 from gravitorch.data.dataloaders import create_dataloader2, setup_dataloader2
 from gravitorch.datapipes import is_datapipe_config
 from gravitorch.engines import BaseEngine
-from gravitorch.utils.imports import is_torchdata_available
 from torch.utils.data import IterDataPipe, MapDataPipe
 
 from gtvision.creators.dataloader2.base import BaseDataLoader2Creator
 from gtvision.creators.datapipe import DataPipeCreator
 from gtvision.creators.datapipe.base import BaseDataPipeCreator, setup_datapipe_creator
 
-if is_torchdata_available():
+if TYPE_CHECKING:
     from torchdata.dataloader2 import DataLoader2, ReadingServiceInterface
     from torchdata.dataloader2.adapter import Adapter
-else:  # pragma: no cover
-    Adapter = "Adapter"
-    DataLoader2 = "DataLoader2"
-    ReadingServiceInterface = "ReadingServiceInterface"
 
 T = TypeVar("T")
 
@@ -59,6 +54,8 @@ class DataLoader2Creator(BaseDataLoader2Creator[T]):
         <torchdata.dataloader2.dataloader2.DataLoader2 object at 0x...>
     """
 
+    __slots__ = ("_dataloader", "_cache")
+
     def __init__(self, dataloader: DataLoader2 | dict, cache: bool = False) -> None:
         self._dataloader = dataloader
         self._cache = bool(cache)
@@ -103,6 +100,8 @@ class VanillaDataLoader2Creator(BaseDataLoader2Creator[T]):
         <torchdata.dataloader2.dataloader2.DataLoader2 object at 0x...>
     """
 
+    __slots__ = ("_datapipe", "_datapipe_adapter_fn", "_reading_service")
+
     def __init__(
         self,
         datapipe: IterDataPipe[T] | MapDataPipe[T] | BaseDataPipeCreator[T] | dict,
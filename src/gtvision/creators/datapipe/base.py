@@ -38,6 +38,8 @@ class BaseDataPipeCreator(Generic[T], ABC, metaclass=AbstractFactory):
         (1, 2, 3, 4)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create(
         self, engine: BaseEngine | None = None, source_inputs: Sequence | None = None
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 __all__ = ["ChainedDataPipeCreator"]
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import TypeVar
 
 from coola.utils.format import str_indent, str_sequence
-from gravitorch.datapipes import create_chained_datapipe
 from gravitorch.engines.base import BaseEngine
+from objectory import OBJECT_TARGET
+from objectory.utils import import_object, instantiate_object
 from torch.utils.data import IterDataPipe, MapDataPipe
 
 from gtvision.creators.datapipe.base import BaseDataPipeCreator
@@ -22,13 +23,21 @@ class ChainedDataPipeCreator(BaseDataPipeCreator[T]):
     Args:
     ----
         config (dict or sequence of dict): Specifies the configuration
-            of the ``DataPipe`` object to create. See description
-            of the ``create_chained_datapipe`` function to
-            learn more about the expected values.
+            of the ``DataPipe`` object to create. The sequence of
+            configurations follows the order of the ``DataPipe``s.
+            The first config is used to create the first ``DataPipe``
+            (a.k.a. source), and the last config is used to create
+            the last ``DataPipe`` (a.k.a. sink). All the DataPipes
+            are assumed to have a single source DataPipe as their
+            first argument, excepts for the source ``DataPipe``.
+
+    The target objects are imported when the creator is instantiated,
+    so the ``create`` method only calls them.
 
     Raises:
     ------
         ValueError if the configuration sequence is empty.
+        RuntimeError if a target object does not exist.
 
     Example usage:
 
@@ -116,12 +125,22 @@ class ChainedDataPipeCreator(BaseDataPipeCreator[T]):
         ([1, 11], [2, 12], [3, 13], [4, 14])
     """
 
+    __slots__ = ("_config", "_resolved")
+
     def __init__(self, config: dict | Sequence[dict]) -> None:
         if not config:
             raise ValueError("It is not possible to create a DataPipe because the config is empty")
         if isinstance(config, dict):
             config = [config]
-        self._config = config
+        # Store a copy so the configuration cannot diverge from the resolved targets.
+        self._config = tuple(cfg.copy() for cfg in config)
+        self._resolved = [
+            (
+                _import_target(cfg[OBJECT_TARGET]),
+                {key: value for key, value in cfg.items() if key != OBJECT_TARGET},
+            )
+            for cfg in self._config
+        ]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(\n  {str_indent(str_sequence(self._config))}\n)"
@@ -129,4 +148,29 @@ class ChainedDataPipeCreator(BaseDataPipeCreator[T]):
     def create(
         self, engine: BaseEngine | None = None, source_inputs: Sequence | None = None
     ) -> IterDataPipe[T] | MapDataPipe[T]:
-        return create_chained_datapipe(config=self._config, source_inputs=source_inputs)
+        datapipe = None
+        for target, kwargs in self._resolved:
+            args = (source_inputs or ()) if datapipe is None else (datapipe,)
+            datapipe = instantiate_object(target, *args, **kwargs)
+        return datapipe
+
+
+def _import_target(name: str) -> Callable:
+    r"""Imports a target object.
+
+    Args:
+    ----
+        name (str): Specifies the name of the target object.
+
+    Returns:
+    -------
+        The target object (class or function).
+
+    Raises:
+    ------
+        RuntimeError if the target object does not exist.
+    """
+    target = import_object(name)
+    if target is None:
+        raise RuntimeError(f"The target object does not exist: {name}")
+    return target
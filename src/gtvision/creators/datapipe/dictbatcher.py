@@ -3,7 +3,7 @@ from __future__ import annotations
 __all__ = ["DictBatcherIterDataPipeCreator"]
 
 from collections.abc import Sequence
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from gravitorch.data.datacreators import BaseDataCreator, setup_datacreator
 from gravitorch.datapipes.iter import DictBatcher
@@ -11,6 +11,7 @@ from gravitorch.engines.base import BaseEngine
 from gravitorch.utils.format import str_indent, str_mapping
 from torch import Tensor
 from torch.utils.data import IterDataPipe, MapDataPipe
+from torch.utils.data.datapipes.iter import Mapper
 
 from gtvision.creators.datapipe.base import BaseDataPipeCreator
 
@@ -25,6 +26,15 @@ class DictBatcherIterDataPipeCreator(BaseDataPipeCreator[T]):
     ----
         data (``BaseDataCreator`` or ``dict``): Specifies the data
             creator or its configuration.
+        pin_memory (bool, optional): If ``True``, the tensors of each
+            batch are copied into pinned memory. This option is only
+            valid when the ``DataPipe`` is iterated in the process
+            that consumes the batches i.e. without worker processes.
+            In a worker process, CUDA cannot be initialized and the
+            pinned memory is lost when the tensors are sent to the
+            main process. With ``torch.utils.data.DataLoader``, set
+            ``pin_memory=True`` on the dataloader instead. It requires
+            a device with CUDA. Default: ``False``
         **kwargs: See documentation of ``DictBatcher``
 
     Example usage:
@@ -48,12 +58,17 @@ class DictBatcherIterDataPipeCreator(BaseDataPipeCreator[T]):
         )
     """
 
-    def __init__(self, data: BaseDataCreator[dict[str, Tensor]] | dict, **kwargs) -> None:
+    __slots__ = ("_data", "_pin_memory", "_kwargs")
+
+    def __init__(
+        self, data: BaseDataCreator[dict[str, Tensor]] | dict, pin_memory: bool = False, **kwargs
+    ) -> None:
         self._data = setup_datacreator(data)
+        self._pin_memory = bool(pin_memory)
         self._kwargs = kwargs
 
     def __repr__(self) -> str:
-        config = {"data": self._data} | self._kwargs
+        config = {"data": self._data, "pin_memory": self._pin_memory} | self._kwargs
         return (
             f"{self.__class__.__qualname__}(\n"
             f"  {str_indent(str_mapping(config, sorted_keys=True))}\n)"
@@ -62,4 +77,30 @@ class DictBatcherIterDataPipeCreator(BaseDataPipeCreator[T]):
     def create(
         self, engine: BaseEngine | None = None, source_inputs: Sequence | None = None
     ) -> IterDataPipe[T] | MapDataPipe[T]:
-        return DictBatcher(self._data.create(engine), **self._kwargs)
+        datapipe = DictBatcher(self._data.create(engine), **self._kwargs)
+        if self._pin_memory:
+            datapipe = Mapper(datapipe, _pin_memory)
+        return datapipe
+
+
+def _pin_memory(data: Any) -> Any:
+    r"""Copies the tensors of a (nested) batch into pinned memory.
+
+    Args:
+    ----
+        data: Specifies the batch. The tensors in nested ``dict``,
+            ``list`` and ``tuple`` objects are also pinned.
+
+    Returns:
+    -------
+        The batch with the tensors in pinned memory.
+    """
+    if isinstance(data, Tensor):
+        return data.pin_memory()
+    if isinstance(data, dict):
+        return {key: _pin_memory(value) for key, value in data.items()}
+    if isinstance(data, tuple) and hasattr(data, "_fields"):  # namedtuple
+        return type(data)(*(_pin_memory(value) for value in data))
+    if isinstance(data, (list, tuple)):
+        return type(data)(_pin_memory(value) for value in data)
+    return data
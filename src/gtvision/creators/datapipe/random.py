@@ -39,6 +39,8 @@ class EpochRandomSeedDataPipeCreator(BaseDataPipeCreator):
             state.
     """
 
+    __slots__ = ("_config", "_random_seed_key")
+
     def __init__(self, config: dict, random_seed_key: str = "random_seed") -> None:
         self._config = config
         self._random_seed_key = str(random_seed_key)
@@ -122,6 +122,8 @@ class SequentialDataPipeCreator(BaseDataPipeCreator):
         ([1, 11], [2, 12], [3, 13], [4, 14])
     """
 
+    __slots__ = ("_creators",)
+
     def __init__(self, creators: Sequence[BaseDataPipeCreator | dict]) -> None:
         if not creators:
             raise ValueError("It is not possible to create a DataPipe because creators is empty")
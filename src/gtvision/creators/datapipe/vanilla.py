@@ -48,6 +48,8 @@ class DataPipeCreator(BaseDataPipeCreator[T]):
         (1, 2, 3, 4)
     """
 
+    __slots__ = ("_datapipe", "_cache", "_deepcopy")
+
     def __init__(
         self,
         datapipe: IterDataPipe[T] | MapDataPipe[T] | dict,
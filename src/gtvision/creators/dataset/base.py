@@ -36,6 +36,8 @@ class BaseDatasetCreator(Generic[T], ABC, metaclass=AbstractFactory):
         DummyMultiClassDataset(num_examples=10, num_classes=2, feature_size=4, noise_std=0.2, ...)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create(self, engine: BaseEngine | None = None) -> Dataset[T]:
         r"""Create a dataset.
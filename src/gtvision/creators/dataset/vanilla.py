@@ -43,6 +43,8 @@ class DatasetCreator(BaseDatasetCreator[T]):
         DummyMultiClassDataset(num_examples=10, num_classes=2, feature_size=4, noise_std=0.2, ...)
     """
 
+    __slots__ = ("_dataset", "_cache")
+
     def __init__(self, dataset: Dataset[T] | dict, cache: bool = False) -> None:
         self._dataset = dataset
         self._cache = bool(cache)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
-__all__ = ["create_compose"]
+__all__ = ["BatchedTransform", "create_compose"]
 
+from gtvision.transforms.batched import BatchedTransform
 from gtvision.transforms.factory import create_compose
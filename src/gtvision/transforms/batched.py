@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+__all__ = ["BatchedTransform"]
+
+import torch
+from torch import Tensor, nn
+
+
+class BatchedTransform(nn.Module):
+    r"""Implements a wrapper to apply a transform on a batch of images
+    on a given device.
+
+    The transform is moved once to the device, and each batch is
+    moved to the device before to apply the transform. Applying the
+    transform on the whole batch avoids one Python call per transform
+    per example.
+
+    Args:
+    ----
+        transform (``torch.nn.Module``): Specifies the transform to
+            apply on the batches. The transform has to support batches
+            of tensors.
+        device (``torch.device`` or str): Specifies the device where
+            the transform is applied.
+
+    Example usage:
+
+    .. code-block:: pycon
+
+        >>> import torch
+        >>> from torchvision.transforms import CenterCrop
+        >>> from gtvision.transforms import BatchedTransform
+        >>> transform = BatchedTransform(CenterCrop(2), device="cpu")
+        >>> transform
+        BatchedTransform(
+          device=cpu
+          (transform): CenterCrop(size=(2, 2))
+        )
+        >>> transform(torch.ones(8, 3, 4, 4)).shape
+        torch.Size([8, 3, 2, 2])
+    """
+
+    def __init__(self, transform: nn.Module, device: torch.device | str) -> None:
+        super().__init__()
+        self.device = torch.device(device)
+        self.transform = transform.to(self.device)
+
+    def extra_repr(self) -> str:
+        return f"device={self.device}"
+
+    def forward(self, batch: Tensor) -> Tensor:
+        r"""Applies the transform on a batch of images.
+
+        Args:
+        ----
+            batch (``torch.Tensor``): Specifies the batch of images.
+
+        Returns:
+        -------
+            ``torch.Tensor``: The transformed batch of images on the
+                device.
+        """
+        return self.transform(batch.to(self.device, non_blocking=True))
@@ -2,26 +2,63 @@ from __future__ import annotations
 
 __all__ = ["create_compose"]
 
+import logging
 from collections.abc import Callable, Sequence
 
+import torch
 from gravitorch.utils import setup_object
-from torchvision.transforms import Compose
+from torch import nn
 
+from gtvision.transforms.batched import BatchedTransform
 
-def create_compose(transforms: Sequence[Callable | dict]) -> Compose:
-    r"""Instantiates a ``torchvision.transforms.Compose`` from its
-    configuration.
+logger = logging.getLogger(__name__)
+
+
+def create_compose(
+    transforms: Sequence[Callable | dict],
+    mode: str = "compose",
+    device: torch.device | str | None = None,
+) -> Callable:
+    r"""Instantiates a composition of transforms from its configuration.
 
     Args:
         transforms (sequence of ``Transform`` objects): Specifies the
             sequence of transforms (or their configuration) to compose.
+        mode (str, optional): Specifies the type of composition.
+            The valid values are:
+
+                - ``"compose"``: a ``torchvision.transforms.Compose``
+                    object that calls the transforms one by one.
+                - ``"sequential"``: a ``torch.nn.Sequential`` object.
+                    All the transforms have to be ``torch.nn.Module``
+                    objects.
+                - ``"gpu_batched"``: a ``BatchedTransform`` object
+                    that applies the ``torch.nn.Sequential`` object
+                    on batches of tensors on ``device``. Staying in
+                    PyTorch avoids the PIL/NumPy conversions and one
+                    Python call per transform per example.
+
+            Default: ``"compose"``
+        device (``torch.device`` or str or ``None``, optional):
+            Specifies the device where the transforms are applied
+            when ``mode="gpu_batched"``. If ``None``, the current CUDA
+            device is used. This argument is ignored for the other
+            modes. Default: ``None``
+
+    Note: if the per-example transforms are the bottleneck of the data
+    pipeline, increasing the number of dataloader workers or the
+    prefetch factor rarely helps. Applying the transforms on batches
+    on the GPU with ``mode="gpu_batched"`` is usually faster.
 
     Returns:
-        ``torchvision.transforms.Compose``: The instantiated
-            composition of transforms
+        ``torchvision.transforms.Compose`` or ``torch.nn.Sequential``
+            or ``BatchedTransform``: The instantiated composition of
+            transforms.
 
     Raises:
-        RuntimeError if ``torchvision`` is not installed.
+        ValueError if ``mode`` is not valid.
+        TypeError if ``mode`` is ``"sequential"`` or ``"gpu_batched"``
+            and a transform is not a ``torch.nn.Module`` object.
 
     Example usage:
 
@@ -35,5 +72,35 @@ def create_compose(transforms: Sequence[Callable | dict]) -> Compose:
         ...         PILToTensor(),
         ...     ]
         ... )
+        >>> create_compose(
+        ...     [{"_target_": "torchvision.transforms.CenterCrop", "size": 10}],
+        ...     mode="sequential",
+        ... )
+        Sequential(
+          (0): CenterCrop(size=(10, 10))
+        )
     """
-    return Compose([setup_object(transform) for transform in transforms])
+    if mode not in {"compose", "sequential", "gpu_batched"}:
+        raise ValueError(
+            f"Incorrect mode: {mode}. The valid values are: 'compose', 'sequential' "
+            "and 'gpu_batched'"
+        )
+    transforms = [setup_object(transform) for transform in transforms]
+    if mode == "compose":
+        # Lazy import because torchvision has many heavy transitive imports.
+        from torchvision.transforms import Compose
+
+        return Compose(transforms)
+    for transform in transforms:
+        if not isinstance(transform, nn.Module):
+            raise TypeError(
+                f"Incorrect transform type: {type(transform)}. All the transforms have to be "
+                f"torch.nn.Module objects when mode is '{mode}'"
+            )
+    transform = nn.Sequential(*transforms)
+    if mode == "sequential":
+        return transform
+    if device is None:
+        device = torch.device("cuda", torch.cuda.current_device())
+    logger.info(f"The transforms are applied on batches on device {device}")
+    return BatchedTransform(transform, device=device)
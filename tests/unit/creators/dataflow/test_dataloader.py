@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from gravitorch.data.datasets import ExampleDataset
 from gravitorch.experimental.dataflow import DataLoaderDataFlow
+from objectory import OBJECT_TARGET
 from torch.utils.data import DataLoader
 
 from gtvision.creators.dataflow import DataLoaderDataFlowCreator
-from gtvision.creators.dataloader import VanillaDataLoaderCreator
+from gtvision.creators.dataflow.dataloader import _is_dataloader_target
+from gtvision.creators.dataloader import DataLoaderCreator, VanillaDataLoaderCreator
 
 ###############################################
 #     Tests for DataLoaderDataFlowCreator     #
@@ -30,3 +32,92 @@ def test_dataloader_dataflow_creator_create_dataloader_creator() -> None:
     ).create()
     assert isinstance(dataflow, DataLoaderDataFlow)
     assert list(dataflow) == [1, 2, 3, 4, 5]
+
+
+def test_dataloader_dataflow_creator_dataloader_config() -> None:
+    creator = DataLoaderDataFlowCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": ExampleDataset((1, 2, 3, 4, 5))}
+    )
+    assert isinstance(creator._dataloader, DataLoaderCreator)
+    assert list(creator.create()) == [1, 2, 3, 4, 5]
+
+
+def test_dataloader_dataflow_creator_dataloader_creator_config() -> None:
+    creator = DataLoaderDataFlowCreator(
+        {
+            OBJECT_TARGET: "gtvision.creators.dataloader.VanillaDataLoaderCreator",
+            "dataset": ExampleDataset((1, 2, 3, 4, 5)),
+        }
+    )
+    assert isinstance(creator._dataloader, VanillaDataLoaderCreator)
+    assert list(creator.create()) == [1, 2, 3, 4, 5]
+
+
+def test_dataloader_dataflow_creator_dataloader_config_cache_true() -> None:
+    creator = DataLoaderDataFlowCreator(
+        {
+            OBJECT_TARGET: "torch.utils.data.DataLoader",
+            "dataset": ExampleDataset((1, 2, 3, 4, 5)),
+            "num_workers": 1,
+        },
+        cache=True,
+    )
+    assert not creator._dataloader._cache
+    assert creator._dataloader._dataloader["persistent_workers"]
+
+
+def test_dataloader_dataflow_creator_create_cache_true() -> None:
+    creator = DataLoaderDataFlowCreator(
+        VanillaDataLoaderCreator(ExampleDataset((1, 2, 3, 4, 5))), cache=True
+    )
+    dataflow1 = creator.create()
+    dataflow2 = creator.create()
+    assert dataflow1.dataloader is dataflow2.dataloader
+    assert list(dataflow1) == [1, 2, 3, 4, 5]
+    assert list(dataflow2) == [1, 2, 3, 4, 5]
+
+
+def test_dataloader_dataflow_creator_create_cache_false() -> None:
+    creator = DataLoaderDataFlowCreator(VanillaDataLoaderCreator(ExampleDataset((1, 2, 3, 4, 5))))
+    assert creator.create().dataloader is not creator.create().dataloader
+
+
+def test_dataloader_dataflow_creator_refresh() -> None:
+    creator = DataLoaderDataFlowCreator(
+        VanillaDataLoaderCreator(ExampleDataset((1, 2, 3, 4, 5))), cache=True
+    )
+    dataflow1 = creator.create()
+    creator.refresh()
+    dataflow2 = creator.create()
+    assert dataflow1.dataloader is not dataflow2.dataloader
+    assert creator.create().dataloader is dataflow2.dataloader
+
+
+def test_dataloader_dataflow_creator_refresh_dataloader_config() -> None:
+    creator = DataLoaderDataFlowCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": ExampleDataset((1, 2, 3, 4, 5))},
+        cache=True,
+    )
+    dataflow1 = creator.create()
+    assert creator.create().dataloader is dataflow1.dataloader
+    creator.refresh()
+    dataflow2 = creator.create()
+    assert dataflow1.dataloader is not dataflow2.dataloader
+    assert list(dataflow2) == [1, 2, 3, 4, 5]
+
+
+##########################################
+#     Tests for _is_dataloader_target     #
+##########################################
+
+
+def test_is_dataloader_target_true() -> None:
+    assert _is_dataloader_target("torch.utils.data.DataLoader")
+
+
+def test_is_dataloader_target_false() -> None:
+    assert not _is_dataloader_target("gtvision.creators.dataloader.VanillaDataLoaderCreator")
+
+
+def test_is_dataloader_target_none() -> None:
+    assert not _is_dataloader_target(None)
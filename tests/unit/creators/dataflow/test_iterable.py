@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from unittest.mock import patch
+
 from gravitorch.experimental.dataflow import IterableDataFlow
 from objectory import OBJECT_TARGET
 
@@ -10,6 +13,18 @@ def create_list() -> list:
     return [1, 2, 3, 4, 5]
 
 
+def create_generator() -> Iterator[int]:
+    yield from (1, 2, 3)
+
+
+class UnknownLengthIterable:
+    def __iter__(self) -> Iterator[int]:
+        return iter([1, 2, 3])
+
+    def __len__(self) -> int:
+        raise TypeError("the length is unknown")
+
+
 #############################################
 #     Tests for IterableDataFlowCreator     #
 #############################################
@@ -29,6 +44,20 @@ def test_iterable_dataflow_creator_str_without_length() -> None:
     )
 
 
+def test_iterable_dataflow_creator_str_length_type_error() -> None:
+    assert (
+        str(IterableDataFlowCreator(UnknownLengthIterable()))
+        == "IterableDataFlowCreator(cache=False)"
+    )
+
+
+def test_iterable_dataflow_creator_str_config() -> None:
+    assert (
+        str(IterableDataFlowCreator({OBJECT_TARGET: "builtins.list"}))
+        == "IterableDataFlowCreator(cache=False)"
+    )
+
+
 def test_iterable_dataflow_creator_create() -> None:
     dataflow = IterableDataFlowCreator((1, 2, 3, 4, 5)).create()
     assert isinstance(dataflow, IterableDataFlow)
@@ -46,6 +75,34 @@ def test_iterable_dataflow_creator_create_cache() -> None:
     assert list(dataflow) == [1, 2, 3, 4, 5]
 
 
+def test_iterable_dataflow_creator_create_no_cache_default_config() -> None:
+    creator = IterableDataFlowCreator(
+        {OBJECT_TARGET: "unit.creators.dataflow.test_iterable.create_list"}
+    )
+    dataflow = creator.create()
+    assert isinstance(creator._iterable, dict)
+    assert list(dataflow) == [1, 2, 3, 4, 5]
+
+
+def test_iterable_dataflow_creator_create_generator_config() -> None:
+    creator = IterableDataFlowCreator(
+        {OBJECT_TARGET: "unit.creators.dataflow.test_iterable.create_generator"}
+    )
+    assert list(creator.create()) == [1, 2, 3]
+    assert list(creator.create()) == [1, 2, 3]
+
+
+def test_iterable_dataflow_creator_create_cache_reuse_iterable() -> None:
+    creator = IterableDataFlowCreator(
+        {OBJECT_TARGET: "unit.creators.dataflow.test_iterable.create_list"}, cache=True
+    )
+    dataflow1 = creator.create()
+    with patch("gtvision.creators.dataflow.iterable.setup_object") as setup_mock:
+        dataflow2 = creator.create()
+        setup_mock.assert_not_called()
+    assert dataflow1.iterable is dataflow2.iterable
+
+
 def test_iterable_dataflow_creator_create_deepcopy() -> None:
     dataflow = IterableDataFlowCreator((1, 2, 3, 4, 5), deepcopy=True).create()
     assert isinstance(dataflow, IterableDataFlow)
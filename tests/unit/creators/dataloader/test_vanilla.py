@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from unittest.mock import Mock
+import logging
+from unittest.mock import Mock, patch
 
 import torch
 from coola import objects_are_equal
 from gravitorch.data.dataloaders.collators import PaddedSequenceCollator
 from gravitorch.engines import BaseEngine
 from objectory import OBJECT_TARGET
-from pytest import fixture, mark
+from pytest import LogCaptureFixture, fixture, mark
 from torch import Tensor
 from torch.utils.data import Dataset, RandomSampler, SequentialSampler
 from torch.utils.data.dataloader import DataLoader, default_collate
+from torch.utils.data.datapipes.iter import IterableWrapper
 
 from gtvision.creators.dataloader import DataLoaderCreator, VanillaDataLoaderCreator
+from gtvision.creators.dataloader.vanilla import (
+    _pin_cpu_worker_init_fn,
+    _worker_init_fn,
+)
 from gtvision.creators.dataset import DatasetCreator
 
 
@@ -132,6 +138,220 @@ def test_dataloader_creator_create_with_engine(dataset: Dataset) -> None:
     )
 
 
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+def test_dataloader_creator_pin_memory_default_cuda(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert creator._dataloader["pin_memory"]
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_pin_memory_default_no_cuda(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert "pin_memory" not in creator._dataloader
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+def test_dataloader_creator_pin_memory_false(dataset: Dataset) -> None:
+    config = {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset, "pin_memory": False}
+    creator = DataLoaderCreator(config)
+    assert not creator._dataloader["pin_memory"]
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+def test_dataloader_creator_pin_memory_does_not_modify_config(dataset: Dataset) -> None:
+    config = {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset}
+    DataLoaderCreator(config)
+    assert config == {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset}
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+def test_dataloader_creator_pin_memory_warning(caplog: LogCaptureFixture, dataset: Dataset) -> None:
+    with caplog.at_level(logging.WARNING):
+        DataLoaderCreator(DataLoader(dataset))
+        assert len(caplog.messages) == 1
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+def test_dataloader_creator_pin_memory_no_warning(
+    caplog: LogCaptureFixture, dataset: Dataset
+) -> None:
+    with caplog.at_level(logging.WARNING):
+        DataLoaderCreator(DataLoader(dataset, pin_memory=True))
+        assert not caplog.messages
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+@patch("torch.cuda.device_count", lambda *args, **kwargs: 2)
+@patch("os.cpu_count", lambda *args, **kwargs: 4)
+def test_dataloader_creator_num_workers_default_cuda(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert creator._dataloader["num_workers"] == 2
+    assert creator._dataloader["prefetch_factor"] == 2
+    assert "persistent_workers" not in creator._dataloader
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+@patch("torch.cuda.device_count", lambda *args, **kwargs: 1)
+@patch("os.cpu_count", lambda *args, **kwargs: 64)
+def test_dataloader_creator_num_workers_default_cuda_max_4(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert creator._dataloader["num_workers"] == 4
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+@patch("torch.cuda.device_count", lambda *args, **kwargs: 8)
+@patch("os.cpu_count", lambda *args, **kwargs: None)
+def test_dataloader_creator_num_workers_default_cuda_min_1(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert creator._dataloader["num_workers"] == 1
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: True)
+@patch("torch.cuda.device_count", lambda *args, **kwargs: 1)
+@patch("os.cpu_count", lambda *args, **kwargs: 4)
+def test_dataloader_creator_num_workers_default_cuda_iterable_dataset() -> None:
+    dataset = IterableWrapper([1, 2, 3, 4])
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert "num_workers" not in creator._dataloader
+    assert "worker_init_fn" not in creator._dataloader
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_num_workers_default_no_cuda(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert creator._dataloader == {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset}
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_num_workers_2(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset, "num_workers": 2}
+    )
+    assert creator._dataloader["prefetch_factor"] == 2
+    assert "persistent_workers" not in creator._dataloader
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_num_workers_2_cache_true(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset, "num_workers": 2},
+        cache=True,
+    )
+    assert creator._dataloader["persistent_workers"]
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_num_workers_2_persistent_workers_true(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset, "num_workers": 2},
+        persistent_workers=True,
+    )
+    assert not creator._cache
+    assert creator._dataloader["persistent_workers"]
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_num_workers_0_cache_true(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset}, cache=True
+    )
+    assert "persistent_workers" not in creator._dataloader
+
+
+def test_dataloader_creator_worker_init_fn_default(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset, "num_workers": 2}
+    )
+    assert creator._dataloader["worker_init_fn"] is _worker_init_fn
+
+
+def test_dataloader_creator_worker_init_fn_pin_worker_cpu(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset, "num_workers": 2},
+        pin_worker_cpu=True,
+    )
+    assert creator._dataloader["worker_init_fn"] is _pin_cpu_worker_init_fn
+
+
+def test_dataloader_creator_worker_init_fn_custom(dataset: Dataset) -> None:
+    worker_init_fn = Mock()
+    creator = DataLoaderCreator(
+        {
+            OBJECT_TARGET: "torch.utils.data.DataLoader",
+            "dataset": dataset,
+            "num_workers": 2,
+            "worker_init_fn": worker_init_fn,
+        }
+    )
+    assert creator._dataloader["worker_init_fn"] is worker_init_fn
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_dataloader_creator_worker_init_fn_num_workers_0(dataset: Dataset) -> None:
+    creator = DataLoaderCreator({OBJECT_TARGET: "torch.utils.data.DataLoader", "dataset": dataset})
+    assert "worker_init_fn" not in creator._dataloader
+
+
+def test_dataloader_creator_persistent_workers_false(dataset: Dataset) -> None:
+    creator = DataLoaderCreator(
+        {
+            OBJECT_TARGET: "torch.utils.data.DataLoader",
+            "dataset": dataset,
+            "num_workers": 2,
+            "persistent_workers": False,
+        },
+        cache=True,
+    )
+    assert not creator._dataloader["persistent_workers"]
+
+
+def test_dataloader_creator_prefetch_factor_warning(
+    caplog: LogCaptureFixture, dataset: Dataset
+) -> None:
+    with caplog.at_level(logging.WARNING):
+        creator = DataLoaderCreator(
+            {
+                OBJECT_TARGET: "torch.utils.data.DataLoader",
+                "dataset": dataset,
+                "num_workers": 2,
+                "prefetch_factor": 8,
+            }
+        )
+        assert creator._dataloader["prefetch_factor"] == 8
+        assert len(caplog.messages) == 1
+
+
+def test_worker_init_fn_does_not_pin_cpu() -> None:
+    setaffinity_mock = Mock()
+    with patch("os.sched_setaffinity", setaffinity_mock, create=True):
+        _worker_init_fn(0)
+        setaffinity_mock.assert_not_called()
+
+
+@patch.dict("os.environ", {"LOCAL_RANK": "0"})
+@mark.parametrize("worker_id,cpu", ((0, 2), (1, 3), (2, 5), (3, 2)))
+def test_pin_cpu_worker_init_fn(worker_id: int, cpu: int) -> None:
+    setaffinity_mock = Mock()
+    with patch("os.sched_getaffinity", Mock(return_value={5, 2, 3}), create=True), patch(
+        "os.sched_setaffinity", setaffinity_mock, create=True
+    ):
+        _pin_cpu_worker_init_fn(worker_id)
+        setaffinity_mock.assert_called_once_with(0, {cpu})
+
+
+@patch.dict("os.environ", {"LOCAL_RANK": "1"})
+def test_pin_cpu_worker_init_fn_local_rank() -> None:
+    setaffinity_mock = Mock()
+    with patch("os.sched_getaffinity", Mock(return_value={0, 1, 2, 3}), create=True), patch(
+        "os.sched_setaffinity", setaffinity_mock, create=True
+    ), patch(
+        "gtvision.creators.dataloader.vanilla.get_worker_info",
+        Mock(return_value=Mock(num_workers=2)),
+    ):
+        _pin_cpu_worker_init_fn(1)
+        setaffinity_mock.assert_called_once_with(0, {3})
+
+
 ##############################################
 #     Tests for VanillaDataLoaderCreator     #
 ##############################################
@@ -139,3 +139,44 @@ def test_chained_datapipe_creator_sequence_multiple_input_datapipes() -> None:
     )
     assert isinstance(datapipe, Batcher)
     assert tuple(datapipe) == ([1, 11], [2, 12], [3, 13], [4, 14])
+
+
+def test_chained_datapipe_creator_create_does_not_modify_config() -> None:
+    config = [
+        {
+            OBJECT_TARGET: "torch.utils.data.datapipes.iter.IterableWrapper",
+            "iterable": [1, 2, 3, 4],
+        },
+        {OBJECT_TARGET: "torch.utils.data.datapipes.iter.Batcher", "batch_size": 2},
+    ]
+    creator = ChainedDataPipeCreator(config)
+    assert tuple(creator.create()) == ([1, 2], [3, 4])
+    assert tuple(creator.create()) == ([1, 2], [3, 4])
+    assert config == [
+        {
+            OBJECT_TARGET: "torch.utils.data.datapipes.iter.IterableWrapper",
+            "iterable": [1, 2, 3, 4],
+        },
+        {OBJECT_TARGET: "torch.utils.data.datapipes.iter.Batcher", "batch_size": 2},
+    ]
+
+
+def test_chained_datapipe_creator_incorrect_target() -> None:
+    with raises(RuntimeError, match="The target object does not exist"):
+        ChainedDataPipeCreator({OBJECT_TARGET: "torch.utils.data.datapipes.iter.Missing"})
+
+
+def test_chained_datapipe_creator_config_modified_after_init() -> None:
+    config = [
+        {OBJECT_TARGET: "torch.utils.data.datapipes.iter.IterableWrapper", "iterable": [1, 2, 3, 4]}
+    ]
+    creator = ChainedDataPipeCreator(config)
+    config.append({OBJECT_TARGET: "torch.utils.data.datapipes.iter.Batcher", "batch_size": 2})
+    config[0]["iterable"] = [5, 6]
+    assert creator._config == (
+        {
+            OBJECT_TARGET: "torch.utils.data.datapipes.iter.IterableWrapper",
+            "iterable": [1, 2, 3, 4],
+        },
+    )
+    assert tuple(creator.create()) == (1, 2, 3, 4)
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from unittest.mock import Mock
 
 import torch
@@ -5,10 +6,13 @@ from coola import objects_are_equal
 from gravitorch.data.datacreators import BaseDataCreator, DataCreator
 from gravitorch.datapipes.iter import DictBatcher
 from gravitorch.engines import BaseEngine
+from gravitorch.testing import cuda_available
 from pytest import fixture
 from torch import Tensor
+from torch.utils.data.datapipes.iter import Mapper
 
 from gtvision.creators.datapipe import DictBatcherIterDataPipeCreator
+from gtvision.creators.datapipe.dictbatcher import _pin_memory
 
 
 @fixture
@@ -59,3 +63,53 @@ def test_dict_batcher_iter_datapipe_creator_create_with_engine() -> None:
             {"key1": torch.ones(2, 3), "key2": torch.zeros(2)},
         ),
     )
+
+
+def test_dict_batcher_iter_datapipe_creator_create_pin_memory(
+    datacreator: BaseDataCreator[dict[str, Tensor]]
+) -> None:
+    datapipe = DictBatcherIterDataPipeCreator(datacreator, batch_size=4, pin_memory=True).create()
+    assert isinstance(datapipe, Mapper)
+    assert isinstance(datapipe.datapipe, DictBatcher)
+
+
+@cuda_available
+def test_dict_batcher_iter_datapipe_creator_create_pin_memory_cuda(
+    datacreator: BaseDataCreator[dict[str, Tensor]]
+) -> None:
+    datapipe = DictBatcherIterDataPipeCreator(datacreator, batch_size=4, pin_memory=True).create()
+    batches = tuple(datapipe)
+    assert all(value.is_pinned() for batch in batches for value in batch.values())
+    assert objects_are_equal(
+        batches,
+        (
+            {"key1": torch.ones(4, 3), "key2": torch.zeros(4)},
+            {"key1": torch.ones(2, 3), "key2": torch.zeros(2)},
+        ),
+    )
+
+
+#################################
+#     Tests for _pin_memory     #
+#################################
+
+
+def test_pin_memory_no_tensor() -> None:
+    assert _pin_memory({"key": [1, "abc", (2, 3)]}) == {"key": [1, "abc", (2, 3)]}
+
+
+def test_pin_memory_no_tensor_namedtuple() -> None:
+    Point = namedtuple("Point", ["x", "y"])
+    data = _pin_memory({"key": [Point(1, "abc"), (2, 3)]})
+    assert data == {"key": [Point(1, "abc"), (2, 3)]}
+    assert isinstance(data["key"][0], Point)
+
+
+@cuda_available
+def test_pin_memory_nested() -> None:
+    data = _pin_memory({"key1": torch.ones(2), "key2": [torch.zeros(3), (torch.ones(1), 1)]})
+    assert data["key1"].is_pinned()
+    assert data["key2"][0].is_pinned()
+    assert data["key2"][1][0].is_pinned()
+    assert isinstance(data["key2"][1], tuple)
+    assert data["key2"][1][1] == 1
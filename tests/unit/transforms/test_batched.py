@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import torch
+from gravitorch.testing import cuda_available
+from torch import nn
+from torchvision.transforms import CenterCrop
+
+from gtvision.transforms import BatchedTransform
+
+######################################
+#     Tests for BatchedTransform     #
+######################################
+
+
+def test_batched_transform_str() -> None:
+    assert str(BatchedTransform(CenterCrop(2), device="cpu")).startswith("BatchedTransform(")
+
+
+def test_batched_transform_forward() -> None:
+    transform = BatchedTransform(nn.Sequential(CenterCrop(2)), device="cpu")
+    assert transform.device == torch.device("cpu")
+    assert transform(torch.ones(8, 3, 4, 4)).equal(torch.ones(8, 3, 2, 2))
+
+
+@cuda_available
+def test_batched_transform_forward_cuda() -> None:
+    transform = BatchedTransform(nn.Sequential(CenterCrop(2)), device="cuda:0")
+    assert transform(torch.ones(8, 3, 4, 4)).equal(torch.ones(8, 3, 2, 2, device="cuda:0"))
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import torch
+from gravitorch.testing import cuda_available
 from objectory import OBJECT_TARGET
+from pytest import raises
+from torch import nn
 from torchvision import transforms
 
-from gtvision.transforms import create_compose
+from gtvision.transforms import BatchedTransform, create_compose
 
 ##########################
 #     create_compose     #
@@ -28,3 +32,87 @@ def test_create_compose_2() -> None:
     assert len(transform.transforms) == 2
     assert isinstance(transform.transforms[0], transforms.CenterCrop)
     assert isinstance(transform.transforms[1], transforms.PILToTensor)
+
+
+def test_create_compose_new_transforms() -> None:
+    config = [{OBJECT_TARGET: "torchvision.transforms.CenterCrop", "size": 10}]
+    transform1 = create_compose(config)
+    transform2 = create_compose(config)
+    assert isinstance(transform1.transforms[0], transforms.CenterCrop)
+    assert isinstance(transform2.transforms[0], transforms.CenterCrop)
+    assert transform1.transforms[0] is not transform2.transforms[0]
+
+
+def test_create_compose_mode_gpu_batched_does_not_share_transforms() -> None:
+    config = [{OBJECT_TARGET: "torch.nn.Linear", "in_features": 4, "out_features": 4}]
+    transform1 = create_compose(config, mode="sequential")
+    transform2 = create_compose(config, mode="gpu_batched", device="cpu")
+    assert transform1[0] is not transform2.transform[0]
+
+
+@cuda_available
+def test_create_compose_mode_gpu_batched_does_not_move_other_transforms() -> None:
+    config = [{OBJECT_TARGET: "torch.nn.Linear", "in_features": 4, "out_features": 4}]
+    transform = create_compose(config, mode="sequential")
+    create_compose(config, mode="gpu_batched", device="cuda")
+    assert transform[0].weight.device == torch.device("cpu")
+
+
+def test_create_compose_mode_sequential() -> None:
+    transform = create_compose(
+        [
+            {OBJECT_TARGET: "torchvision.transforms.CenterCrop", "size": 2},
+            transforms.Normalize(mean=(0.5, 0.5, 0.5), std=(0.5, 0.5, 0.5)),
+        ],
+        mode="sequential",
+    )
+    assert isinstance(transform, nn.Sequential)
+    assert len(transform) == 2
+    assert isinstance(transform[0], transforms.CenterCrop)
+    assert isinstance(transform[1], transforms.Normalize)
+    assert transform(torch.ones(8, 3, 4, 4)).equal(torch.ones(8, 3, 2, 2))
+
+
+def test_create_compose_mode_sequential_incorrect_type() -> None:
+    with raises(TypeError, match="Incorrect transform type"):
+        create_compose([transforms.PILToTensor()], mode="sequential")
+
+
+@cuda_available
+def test_create_compose_mode_gpu_batched() -> None:
+    transform = create_compose(
+        [{OBJECT_TARGET: "torchvision.transforms.CenterCrop", "size": 2}], mode="gpu_batched"
+    )
+    assert isinstance(transform, BatchedTransform)
+    assert transform.device.type == "cuda"
+    assert transform(torch.ones(8, 3, 4, 4)).equal(torch.ones(8, 3, 2, 2, device="cuda"))
+
+
+def test_create_compose_mode_gpu_batched_device_cpu() -> None:
+    transform = create_compose(
+        [
+            {OBJECT_TARGET: "torchvision.transforms.CenterCrop", "size": 2},
+            transforms.Normalize(mean=(0.5, 0.5, 0.5), std=(0.5, 0.5, 0.5)),
+        ],
+        mode="gpu_batched",
+        device="cpu",
+    )
+    assert isinstance(transform, BatchedTransform)
+    assert transform.device == torch.device("cpu")
+    assert isinstance(transform.transform, nn.Sequential)
+    assert transform(torch.ones(8, 3, 4, 4)).equal(torch.ones(8, 3, 2, 2))
+
+
+def test_create_compose_mode_compose_ignore_device() -> None:
+    transform = create_compose([transforms.PILToTensor()], device="cpu")
+    assert isinstance(transform, transforms.Compose)
+
+
+def test_create_compose_mode_gpu_batched_incorrect_type() -> None:
+    with raises(TypeError, match="Incorrect transform type"):
+        create_compose([transforms.PILToTensor()], mode="gpu_batched")
+
+
+def test_create_compose_incorrect_mode() -> None:
+    with raises(ValueError, match="Incorrect mode"):
+        create_compose([transforms.PILToTensor()], mode="incorrect")